@@ -1,11 +1,15 @@
 # engine.py
-import os, site, time, threading, queue, logging, re
+import os, sys, site, time, threading, queue, logging, re, asyncio, collections
 from multiprocessing import freeze_support
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum, auto
 
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
+# Keep freed decode buffers pooled instead of cudaFree/cudaMalloc per chunk.
+# Must be set before CUDA is initialized; the transcription subprocess inherits it.
+# CTranslate2's own caching allocator is left at its defaults (blocks up to 16 MiB are
+# cached); shrinking it would push Whisper's multi-MB activations back to cudaMalloc.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
 
 # Add cuDNN DLL dir if using pip nvidia-cudnn-cu12
 for sp in site.getsitepackages():
@@ -19,11 +23,12 @@ logging.basicConfig(level=logging.ERROR)
 for name in ("RealtimeSTT", "ctranslate2", "faster_whisper"):
     logging.getLogger(name).setLevel(logging.ERROR)
 
-from RealtimeSTT import AudioToTextRecorder
 from pynput import keyboard
 import pyautogui
 import pyperclip
-import torch
+
+# Phases are posted to the UI as-is, so both sides share the UI's enum
+from ui.widgets import Phase
 
 # pynvml for accurate GPU memory (same as Task Manager)
 try:
@@ -33,70 +38,106 @@ try:
 except Exception:
     PYNVML_AVAILABLE = False
 
+# torch (~500 ms to import) is only needed for the no-NVML fallback; load it on first use
+_torch = None
+
+def _import_torch():
+    global _torch
+    if _torch is None:
+        import torch
+        _torch = torch
+    return _torch
+
 
 # ============================================================
 # Config
 # ============================================================
 @dataclass
 class Config:
-    model: str = "medium"
+    model: str = "large-v3-turbo"
     language: str = "en"
     device: str = "cuda"
+    compute_type: str = "int8_float16"  # INT8 weights, FP16 activations
     debug: bool = False  # show debug info in UI when True
+    win32_hotkeys: bool = False  # Windows: RegisterHotKey instead of pynput (also catches AltGr)
     # Speech end cutoff tuning
     post_speech_silence_duration: float = 0.4    # higher = less eager to finalize
     silero_deactivity_detection: bool = True     # more robust end-of-speech
     webrtc_sensitivity: int = 3                  # 0-3, higher = more sensitive
     silero_sensitivity: float = 0.5              # 0-1, higher = more sensitive
+    silero_use_onnx: bool = None                 # None = RealtimeSTT picks its fastest Silero backend
     # Realtime transcription
     enable_realtime_transcription: bool = True
-    realtime_processing_pause: float = 0.15
+    realtime_processing_pause: float = 0.1
+    beam_size: int = 5                           # finals: beam search
+    beam_size_realtime: int = 1                  # drafts: greedy, they get overwritten anyway
     allowed_latency_limit: int = 140
 
 
+# Tried in order when the configured compute_type isn't supported by the device
+COMPUTE_TYPE_FALLBACKS = ("int8_float16", "int8", "float16")
+
+def pick_compute_type(device: str, preferred: str) -> str:
+    """Return the first compute_type in the fallback chain the device supports."""
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception:
+        return preferred  # can't probe - let faster-whisper decide
+    for ct in (preferred,) + COMPUTE_TYPE_FALLBACKS:
+        if ct in supported:
+            return ct
+    return "default"
+
+
 # ============================================================
-# State Enums
+# GPU stats payload (all sizes in GB)
 # ============================================================
-class Phase(Enum):
-    OFF = auto()         # dictation toggled off
-    LISTENING = auto()   # VAD listening, no speech yet
-    SPEAKING = auto()    # speech detected
-    THINKING = auto()    # transcribing / finalizing
-    LOADING = auto()     # model loading at startup
+GpuStats = collections.namedtuple("GpuStats", "cuda name app system free total")
+NO_GPU = GpuStats(cuda=False, name="", app=0.0, system=0.0, free=0.0, total=1.0)
 
 
 # ============================================================
 # Session Logger (change #2)
 # ============================================================
+_SESSION_RE = re.compile(r"session_(\d+)\.txt$")
+
 class SessionLogger:
     def __init__(self, base_dir: str = "logs"):
         self.base_dir = base_dir
         self.session_id = 0
         self.path = ""
+        self._fh = None  # kept open for the whole session
     
     def open_new_session(self) -> int:
         os.makedirs(self.base_dir, exist_ok=True)
         existing = []
         for fn in os.listdir(self.base_dir):
-            m = re.match(r"session_(\d+)\.txt$", fn)
+            m = _SESSION_RE.match(fn)
             if m:
                 existing.append(int(m.group(1)))
         self.session_id = (max(existing) + 1) if existing else 1
         self.path = os.path.join(self.base_dir, f"session_{self.session_id:03d}.txt")
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(f"Session {self.session_id:03d} — {datetime.now().isoformat(timespec='seconds')}\n")
-            f.write("=" * 60 + "\n\n")
+        self._fh = open(self.path, "a", encoding="utf-8", buffering=8192)
+        self._fh.write(f"Session {self.session_id:03d} — {datetime.now().isoformat(timespec='seconds')}\n")
+        self._fh.write("=" * 60 + "\n\n")
+        self._fh.flush()
         return self.session_id
     
     def append_recording(self, recording_id: int, lines: list) -> None:
-        if not self.path:
-            return
-        text = "\n".join(line.strip() for line in lines if line.strip())
-        if not text:
+        # Lines are finals, already stripped and non-empty at the recorder boundary
+        if self._fh is None or not lines:
             return
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(f"[Recording {recording_id}] {datetime.now().isoformat(timespec='seconds')}\n")
-            f.write(text + "\n\n")
+        text = "\n".join(lines)
+        self._fh.write(f"[Recording {recording_id}] {datetime.now().isoformat(timespec='seconds')}\n")
+        self._fh.write(text + "\n\n")
+        # Recordings are only appended on toggle-off/quit - flush at that boundary
+        self._fh.flush()
+    
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
 
 # ============================================================
@@ -106,34 +147,54 @@ VK_D = 68
 VK_Q = 81
 VK_C = 67
 
-def is_ctrl(k): return k in (keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r)
-def is_alt(k):  return k in (keyboard.Key.alt, keyboard.Key.alt_l, keyboard.Key.alt_r)
-def is_vk(k, code): return isinstance(k, keyboard.KeyCode) and k.vk == code
+# Win32 RegisterHotKey (opt-in, Config.win32_hotkeys): fires only for our chords, unlike
+# a low-level keyboard hook. Windows reports AltGr as Ctrl+Alt, so on layouts that type
+# characters with AltGr+D/C/Q those keys are swallowed system-wide - hence not the default.
+WIN_MOD_ALT = 0x0001
+WIN_MOD_CONTROL = 0x0002
+WIN_MOD_NOREPEAT = 0x4000
+WM_HOTKEY = 0x0312
+WM_QUIT = 0x0012
+WIN_HOTKEYS = ((1, VK_D, "D"), (2, VK_C, "C"), (3, VK_Q, "Q"))  # (id, vk, label)
+
+# pynput (default): bits tracked in DictationEngine._mods.
+# Each physical modifier has its own bit, so releasing one side doesn't drop
+# the modifier while the other side is still held.
+MOD_CTRL_ANY, MOD_CTRL_L, MOD_CTRL_R = 1, 2, 4
+MOD_ALT_ANY, MOD_ALT_L, MOD_ALT_R = 8, 16, 32
+MOD_D, MOD_Q, MOD_C = 64, 128, 256
+MOD_CTRL = MOD_CTRL_ANY | MOD_CTRL_L | MOD_CTRL_R  # masks: any ctrl / any alt held
+MOD_ALT = MOD_ALT_ANY | MOD_ALT_L | MOD_ALT_R
+
+_KEY_BITS = {
+    keyboard.Key.ctrl: MOD_CTRL_ANY, keyboard.Key.ctrl_l: MOD_CTRL_L, keyboard.Key.ctrl_r: MOD_CTRL_R,
+    keyboard.Key.alt: MOD_ALT_ANY, keyboard.Key.alt_l: MOD_ALT_L, keyboard.Key.alt_r: MOD_ALT_R,
+}
+_VK_BITS = {VK_D: MOD_D, VK_Q: MOD_Q, VK_C: MOD_C}
+
+def key_bit(k):
+    """Map a pynput key to its MOD_* bit (0 for keys we don't track)."""
+    if isinstance(k, keyboard.KeyCode):
+        return _VK_BITS.get(k.vk, 0)
+    return _KEY_BITS.get(k, 0)
 
 
 # ============================================================
 # Typing helpers (change #3 - clipboard mode)
 # ============================================================
+# Both expect non-empty, already-stripped text (stripped once in the finalize worker)
 def type_direct(text: str) -> None:
-    text = (text or "").strip()
-    if not text:
-        return
     pyautogui.typewrite(text + " ")
 
 def type_clipboard(text: str) -> None:
     """Clipboard paste method - more robust in some apps."""
-    text = (text or "").strip()
-    if not text:
-        return
     old = None
     try:
         old = pyperclip.paste()
     except Exception:
         old = None
     pyperclip.copy(text + " ")
-    time.sleep(0.01)
     pyautogui.hotkey("ctrl", "v")
-    time.sleep(0.01)
     if old is not None:
         try:
             pyperclip.copy(old)
@@ -150,17 +211,22 @@ class DictationEngine:
       ("status", str)           # status message
       ("phase", Phase)          # current phase (change #5)
       ("draft", str)            # live transcription (overwrites)
-      ("final", str)            # finalized chunk
-      ("gpu", dict)             # periodic GPU stats
+      ("final", str)            # finalized chunk (stripped, never empty)
+      ("gpu", GpuStats)         # periodic GPU stats
       ("clear", None)           # clear display on toggle-off (change #1)
     """
     def __init__(self, config: Config = None):
         self.config = config or Config()
         
-        self.events = queue.Queue()
+        self.events = collections.deque()  # engine threads append, UI popleft()s - both atomic
+        self.events_ready = asyncio.Event()  # set on the UI loop whenever events are queued
+        self.stopped = asyncio.Event()       # asyncio mirror of stop_event for the UI loop
+        self._loop = None                    # UI event loop, see attach_loop()
         self.stop_event = threading.Event()
-        self.dictation_on = False
-        self.clipboard_mode = False  # (change #3)
+        self._on_event = threading.Event()  # set while dictation is on
+        self._wake = threading.Event()      # set on toggle-on or stop; wakes idle workers
+        self.clipboard_mode = True  # one paste per chunk instead of a keystroke per char
+        self._type_queue = queue.Queue()  # finals waiting to be typed (None = stop)
         
         # Session tracking (change #2)
         self.logger = SessionLogger()
@@ -168,28 +234,66 @@ class DictationEngine:
         self.recording_id = 0
         self._current_recording_lines = []  # lines for current recording
         
-        self._pressed = set()
+        self._mods = 0  # MOD_* bits currently held
         self._hotkey_lock = False
         
         self.recorder = None
         self._listener = None
+        self._hotkey_thread = None     # Win32 message pump thread
+        self._hotkey_thread_id = None
         self._threads = []
         self._model_ready = threading.Event()
         
         # VRAM tracking - baseline before model loads
         self._vram_baseline_free = None
+        
+        # NVML handle and device name never change - look them up once
+        self._nvml_handle = None
+        self._nvml_name = ""
+        if PYNVML_AVAILABLE:
+            try:
+                self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                self._nvml_name = pynvml.nvmlDeviceGetName(self._nvml_handle)
+            except Exception:
+                self._nvml_handle = None
+    
+    @property
+    def dictation_on(self) -> bool:
+        return self._on_event.is_set()
+    
+    def _stop(self):
+        self.stop_event.set()
+        self._wake.set()
+        self._call_in_loop(self.stopped.set)
     
     # ---- event helpers ----
+    def attach_loop(self, loop):
+        """Wake `events_ready` on *loop* (the UI's) whenever an event is emitted."""
+        self._loop = loop
+        self._call_in_loop(self.events_ready.set)  # anything queued before attach
+        if self.stop_event.is_set():
+            self._call_in_loop(self.stopped.set)
+    
+    def _call_in_loop(self, callback):
+        """Run *callback* on the UI loop; no-op before attach_loop() or after it closes."""
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            pass  # UI loop already closed
+    
     def _emit(self, kind, payload):
-        self.events.put((kind, payload))
+        self.events.append((kind, payload))
+        # Already set = consumer hasn't cleared yet and will see this event when it drains
+        if not self.events_ready.is_set():
+            self._call_in_loop(self.events_ready.set)
     
     def _gpu_stats(self):
         # Use pynvml for accurate readings (same as Task Manager)
-        if PYNVML_AVAILABLE:
+        if self._nvml_handle is not None:
             try:
-                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-                info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                name = pynvml.nvmlDeviceGetName(handle)
+                info = pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
                 
                 total = info.total
                 used = info.used
@@ -205,20 +309,21 @@ class DictationEngine:
                 # System = baseline usage (what was used before our app started)
                 system_used = total - self._vram_baseline_free
                 
-                return {
-                    "cuda": True,
-                    "gpu": name,
-                    "vram_free_gb": round(free / (1024**3), 2),
-                    "vram_total_gb": round(total / (1024**3), 2),
-                    "vram_app_gb": round(app_used / (1024**3), 2),
-                    "vram_system_gb": round(max(0, system_used) / (1024**3), 2),
-                }
+                return GpuStats(
+                    cuda=True,
+                    name=self._nvml_name,
+                    app=round(app_used / (1024**3), 2),
+                    system=round(max(0, system_used) / (1024**3), 2),
+                    free=round(free / (1024**3), 2),
+                    total=round(total / (1024**3), 2),
+                )
             except Exception:
                 pass  # Fall through to torch method
         
         # Fallback to torch (less accurate but works)
+        torch = _import_torch()
         if not torch.cuda.is_available():
-            return {"cuda": False}
+            return NO_GPU
         dev = torch.cuda.current_device()
         free, total = torch.cuda.mem_get_info(dev)
         
@@ -228,38 +333,35 @@ class DictationEngine:
         app_used = max(0, self._vram_baseline_free - free)
         system_used = total - self._vram_baseline_free
         
-        return {
-            "cuda": True,
-            "gpu": torch.cuda.get_device_name(dev),
-            "vram_free_gb": round(free / (1024**3), 2),
-            "vram_total_gb": round(total / (1024**3), 2),
-            "vram_app_gb": round(app_used / (1024**3), 2),
-            "vram_system_gb": round(max(0, system_used) / (1024**3), 2),
-        }
+        return GpuStats(
+            cuda=True,
+            name=torch.cuda.get_device_name(dev),
+            app=round(app_used / (1024**3), 2),
+            system=round(max(0, system_used) / (1024**3), 2),
+            free=round(free / (1024**3), 2),
+            total=round(total / (1024**3), 2),
+        )
     
     # ---- typing ----
     def _type_final(self, text: str):
-        t = (text or "").strip()
-        if not t:
-            return
         if self.clipboard_mode:
-            type_clipboard(t)
+            type_clipboard(text)
         else:
-            type_direct(t)
+            type_direct(text)
     
     # ---- hotkeys ----
     def _toggle(self):
-        was_on = self.dictation_on
-        self.dictation_on = not self.dictation_on
-        
-        if self.dictation_on:
+        if not self.dictation_on:
             # Turning ON: start new recording
             self.recording_id += 1
             self._current_recording_lines = []
+            self._on_event.set()
+            self._wake.set()
             self._emit("phase", Phase.LISTENING)
             self._emit("status", f"DICTATION ON (Recording {self.recording_id})")
         else:
             # Turning OFF: save recording to disk, clear display (change #1)
+            self._on_event.clear()
             if self._current_recording_lines:
                 self.logger.append_recording(self.recording_id, self._current_recording_lines)
             self._emit("phase", Phase.OFF)
@@ -276,58 +378,82 @@ class DictationEngine:
         if self.dictation_on and self._current_recording_lines:
             self.logger.append_recording(self.recording_id, self._current_recording_lines)
         self._emit("status", "QUIT")
-        self.stop_event.set()
+        self._stop()
     
     def _on_press(self, key):
-        self._pressed.add(key)
-        
-        ctrl_down = any(is_ctrl(k) for k in self._pressed)
-        alt_down = any(is_alt(k) for k in self._pressed)
-        if not (ctrl_down and alt_down):
-            return
-        
-        if self._hotkey_lock:
+        self._mods |= key_bit(key)
+        mods = self._mods
+        if not (mods & MOD_CTRL and mods & MOD_ALT) or self._hotkey_lock:
             return
         
-        if any(is_vk(k, VK_D) for k in self._pressed):
+        if mods & MOD_D:
             self._hotkey_lock = True
             self._toggle()
-            return
-        
-        if any(is_vk(k, VK_C) for k in self._pressed):
+        elif mods & MOD_C:
             self._hotkey_lock = True
             self._toggle_clipboard()
-            return
-        
-        if any(is_vk(k, VK_Q) for k in self._pressed):
+        elif mods & MOD_Q:
             self._hotkey_lock = True
             self._quit()
-            return
     
     def _on_release(self, key):
-        self._pressed.discard(key)
-        if not any(is_ctrl(k) for k in self._pressed) or not any(is_alt(k) for k in self._pressed):
+        mods = self._mods = self._mods & ~key_bit(key)
+        if not (mods & MOD_CTRL and mods & MOD_ALT):
             self._hotkey_lock = False
     
+    def _worker_hotkeys_win32(self):
+        """Register the global hotkeys and pump WM_HOTKEY until WM_QUIT."""
+        import ctypes
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+        self._hotkey_thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        
+        handlers = {1: self._toggle, 2: self._toggle_clipboard, 3: self._quit}
+        mods = WIN_MOD_CONTROL | WIN_MOD_ALT | WIN_MOD_NOREPEAT
+        registered = []
+        for hotkey_id, vk, label in WIN_HOTKEYS:
+            if user32.RegisterHotKey(None, hotkey_id, mods, vk):
+                registered.append(hotkey_id)
+            else:
+                self._emit("status", f"ERR hotkey Ctrl+Alt+{label} is taken by another app")
+        
+        msg = wintypes.MSG()
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_HOTKEY:
+                    handler = handlers.get(msg.wParam)
+                    if handler:
+                        handler()
+        finally:
+            for hotkey_id in registered:
+                user32.UnregisterHotKey(None, hotkey_id)
+    
     # ---- workers ----
     def _worker_gpu_poll(self):
+        last_free = None
         while not self.stop_event.is_set():
-            self._emit("gpu", self._gpu_stats())
-            time.sleep(0.5)
+            stats = self._gpu_stats()
+            free = stats.free
+            # Only report real changes (>= ~50 MB), not allocator noise
+            if last_free is None or abs(free - last_free) >= 0.05:
+                self._emit("gpu", stats)
+                last_free = free
+            self.stop_event.wait(2.0)
     
     def _worker_model_load(self):
         """Load model in background."""
+        # Imported here: RealtimeSTT pulls in torch, which would otherwise delay the UI
+        from RealtimeSTT import AudioToTextRecorder
+        
         cfg = self.config
         self._emit("phase", Phase.LOADING)
         
-        # Detailed loading messages
-        self._emit("status", f"[1/4] Initializing Whisper model: {cfg.model}")
-        self._emit("status", f"[2/4] Device: {cfg.device} | Language: {cfg.language}")
+        compute_type = pick_compute_type(cfg.device, cfg.compute_type)
+        start_time = time.time()
         
-        import time as _time
-        start_time = _time.time()
-        
-        self._emit("status", f"[3/4] Loading {cfg.model} model + Silero VAD (this may take 10-30s)...")
+        # One status for the whole load - the UI would only show the last one anyway
+        self._emit("status", f"Loading {cfg.model} ({cfg.device}, {compute_type}, {cfg.language}) "
+                             f"+ Silero VAD (this may take 10-30s)...")
         
         # VAD callbacks for state tracking
         # Note: callbacks may receive args depending on RealtimeSTT version, so accept *args
@@ -352,16 +478,30 @@ class DictationEngine:
             if self.dictation_on:
                 self._emit("draft", t or "")
         
+        # Note: drafts need no batching of our own. RealtimeSTT already runs the realtime
+        # model through faster-whisper's BatchedInferencePipeline (realtime_batch_size,
+        # default 16), and each draft is a single window - one batch item either way.
+        # Note: there is no host->device copy to overlap from here. faster-whisper computes
+        # features on the CPU and CTranslate2 uploads them itself (inside RealtimeSTT's
+        # transcription process), so no torch tensor or CUDA stream is exposed to this code.
+        # Likewise torch.compile has nothing to compile: the decoder is CTranslate2, not a
+        # torch module, and AudioToTextRecorder doesn't forward WhisperModel(flash_attention=).
+        # For the same reason torch.cuda.empty_cache() has nothing to trim in this process:
+        # decode buffers belong to CTranslate2 (in the subprocess for finals), not torch.
         self.recorder = AudioToTextRecorder(
             device=cfg.device,
             model=cfg.model,
+            compute_type=compute_type,
             language=cfg.language,
             enable_realtime_transcription=cfg.enable_realtime_transcription,
             realtime_processing_pause=cfg.realtime_processing_pause,
+            beam_size=cfg.beam_size,
+            beam_size_realtime=cfg.beam_size_realtime,
             silero_deactivity_detection=cfg.silero_deactivity_detection,
             post_speech_silence_duration=cfg.post_speech_silence_duration,
             webrtc_sensitivity=cfg.webrtc_sensitivity,
             silero_sensitivity=cfg.silero_sensitivity,
+            silero_use_onnx=cfg.silero_use_onnx,
             allowed_latency_limit=cfg.allowed_latency_limit,
             spinner=False,
             level=30,  # WARNING
@@ -374,8 +514,8 @@ class DictationEngine:
             on_realtime_transcription_stabilized=on_rt_update,
         )
         
-        elapsed = _time.time() - start_time
-        self._emit("status", f"[4/4] Model loaded in {elapsed:.1f}s - Ready!")
+        elapsed = time.time() - start_time
+        self._emit("status", f"Model loaded in {elapsed:.1f}s ({compute_type}) - Ready!")
         self._emit("phase", Phase.OFF)
         self._model_ready.set()
     
@@ -386,20 +526,38 @@ class DictationEngine:
         
         while not self.stop_event.is_set():
             if not self.dictation_on:
-                time.sleep(0.05)
+                # Sleep until toggled on or stopped - no polling while off
+                self._wake.wait()
+                self._wake.clear()
                 continue
             try:
-                final_text = self.recorder.text()  # blocks until VAD-final
+                final_text = (self.recorder.text() or "").strip()  # blocks until VAD-final
                 if self.dictation_on and final_text:
                     self._emit("final", final_text)
                     self._current_recording_lines.append(final_text)
-                    self._type_final(final_text)
+                    self._type_queue.put(final_text)
                     # Back to listening after final
                     self._emit("phase", Phase.LISTENING)
             except Exception as e:
                 self._emit("status", f"ERR finalize: {e}")
                 time.sleep(0.1)
     
+    def _worker_type(self):
+        """Type finalized chunks, merging any that queued up during the last paste."""
+        while True:
+            texts = [self._type_queue.get()]
+            while True:
+                try:
+                    texts.append(self._type_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in texts:
+                break
+            try:
+                self._type_final(" ".join(texts))
+            except Exception as e:
+                self._emit("status", f"ERR type: {e}")
+    
     # ---- public ----
     def start(self):
         freeze_support()
@@ -409,24 +567,41 @@ class DictationEngine:
         self._emit("status", f"Session {self.session_id:03d} started")
         
         # Start hotkey listener immediately
-        self._listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)
-        self._listener.start()
+        if sys.platform == "win32" and self.config.win32_hotkeys:
+            t = self._hotkey_thread = threading.Thread(target=self._worker_hotkeys_win32, daemon=True)
+            t.start()
+            self._threads.append(t)
+        else:
+            self._listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)
+            self._listener.start()
         
         # Start workers
-        for target in (self._worker_model_load, self._worker_finalize_and_type, self._worker_gpu_poll):
+        for target in (self._worker_model_load, self._worker_finalize_and_type,
+                       self._worker_type, self._worker_gpu_poll):
             t = threading.Thread(target=target, daemon=True)
             t.start()
             self._threads.append(t)
     
     def shutdown(self):
-        self.stop_event.set()
+        self._stop()
+        self._type_queue.put(None)
+        # Stop hotkeys before closing the log - a late Ctrl+Alt+D would append to it
         try:
+            if self._hotkey_thread_id:
+                import ctypes
+                ctypes.windll.user32.PostThreadMessageW(self._hotkey_thread_id, WM_QUIT, 0, 0)
+            if self._hotkey_thread:
+                self._hotkey_thread.join(timeout=1.0)
             if self._listener:
                 self._listener.stop()
+                self._listener.join(timeout=1.0)
         except Exception:
             pass
+        self.logger.close()
         try:
             if self.recorder:
                 self.recorder.shutdown()
         except Exception:
             pass
+        # Release model weights now rather than at interpreter exit
+        self.recorder = None
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-import queue
+import time
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Any
 
 from textual.app import App, ComposeResult
@@ -13,7 +14,13 @@ from rich.text import Text
 from .widgets import StatusHeader, DictationLog, DraftLine, VRAMFooter, Phase
 
 if TYPE_CHECKING:
-    from engine import DictationEngine
+    from engine import DictationEngine, GpuStats
+
+
+# VRAM level by % free: above the last threshold is normal, at or below the first critical
+_LEVELS = ("critical", "danger", "warning", "normal")
+_NORMAL_TH = (15, 30, 50)
+_DEBUG_TH = (60, 70, 80)
 
 
 class DictationPanel(Vertical):
@@ -32,9 +39,13 @@ class DictationApp(App):
     """Textual app for RealtimeSTT dictation with real scrolling."""
     
     CSS_PATH = "styles.tcss"
+    MAX_BATCH = 64     # events applied per drain before yielding to the renderer
+    VRAM_EPSILON = 0.05  # GB; smaller VRAM moves aren't worth a repaint
+    GPU_MIN_INTERVAL = 0.5  # seconds between applied GPU updates
+    ACTIVE_PHASES = frozenset({Phase.LISTENING, Phase.SPEAKING})  # draft cursor shown
     
     # Override default Ctrl+C to prevent quit confirmation dialog
-    # Our hotkeys (Ctrl+Alt+D/C/Q) are handled by pynput globally
+    # Our hotkeys (Ctrl+Alt+D/C/Q) are registered globally by the engine
     BINDINGS = [
         ("ctrl+c", "noop", ""),  # Disable default Ctrl+C
     ]
@@ -44,6 +55,14 @@ class DictationApp(App):
         self.engine = engine
         self._blink_state = True
         self._chunk_count = 0
+        self._vram_level = None  # last vram-* class applied to the screen
+        self._pending_gpu = None  # newest GPU payload not yet applied
+        self._last_gpu_apply_ts = 0.0
+        self._gpu_timer = None
+        # Created in on_mount; None until then so an early quit/unmount is safe
+        self._poll_worker = None
+        self._stop_worker = None
+        self._blink_timer = None
     
     def action_noop(self) -> None:
         """Do nothing - placeholder for disabled bindings."""
@@ -51,10 +70,17 @@ class DictationApp(App):
     
     def action_quit(self) -> None:
         """Override default quit to skip confirmation dialog."""
-        self.exit()
+        self._cancel_workers_and_exit()
     
     def action_request_quit(self) -> None:
         """Override to skip confirmation dialog."""
+        self._cancel_workers_and_exit()
+    
+    def _cancel_workers_and_exit(self) -> None:
+        """Cancel the app's event workers, then exit."""
+        for worker in (self._poll_worker, self._stop_worker):
+            if worker is not None:
+                worker.cancel()
         self.exit()
     
     def compose(self) -> ComposeResult:
@@ -67,117 +93,168 @@ class DictationApp(App):
     
     async def on_mount(self) -> None:
         """Called when app is mounted - start event processing."""
+        # Resolve widgets once; the tree is static after compose
+        self._status_header = self.query_one("#header", StatusHeader)
+        self._dictation_panel = self.query_one("#dictation-panel", DictationPanel)
+        self._dictation_log = self.query_one("#log", DictationLog)
+        self._draft_line = self.query_one("#draft", DraftLine)
+        self._vram_footer = self.query_one("#vram", VRAMFooter)
+        
         # Initialize header with session info
-        header = self.query_one("#header", StatusHeader)
+        header = self._status_header
         header.session_id = self.engine.session_id
         header.debug = self.engine.config.debug
+        header.clipboard_mode = self.engine.clipboard_mode
         
         # Start background tasks
-        self.run_worker(self._poll_engine_events(), exclusive=False)
-        self.run_worker(self._blink_cursor(), exclusive=False)
+        self.engine.attach_loop(asyncio.get_running_loop())
+        self._poll_worker = self.run_worker(self._poll_engine_events(), exclusive=False)
+        self._stop_worker = self.run_worker(self._wait_engine_stopped(), exclusive=False)
+        self._blink_timer = self.set_interval(0.6, self._tick_blink)
     
-    async def _poll_engine_events(self) -> None:
-        """Poll engine events and update UI."""
-        header = self.query_one("#header", StatusHeader)
-        panel = self.query_one("#dictation-panel", DictationPanel)
-        log = self.query_one("#log", DictationLog)
-        draft = self.query_one("#draft", DraftLine)
-        vram = self.query_one("#vram", VRAMFooter)
+    def on_unmount(self) -> None:
+        """Stop the cursor blink timer."""
+        if self._blink_timer is not None:
+            self._blink_timer.stop()
+    
+    def _set_if_moved(self, widget, attr: str, value: float) -> None:
+        """Assign a float reactive only if it moved by at least VRAM_EPSILON."""
+        if abs(value - getattr(widget, attr)) >= self.VRAM_EPSILON:
+            setattr(widget, attr, value)
+    
+    def _flush_gpu(self) -> None:
+        """Apply the newest pending GPU payload, at most once per GPU_MIN_INTERVAL."""
+        if self._pending_gpu is None:
+            return
+        wait = self._last_gpu_apply_ts + self.GPU_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            # Too soon - apply whatever is newest when the interval is up
+            if self._gpu_timer is None:
+                self._gpu_timer = self.set_timer(wait, self._on_gpu_timer)
+            return
+        gpu, self._pending_gpu = self._pending_gpu, None
+        self._last_gpu_apply_ts = time.monotonic()
+        self._apply_gpu(gpu)
+    
+    def _on_gpu_timer(self) -> None:
+        """Deferred GPU update is due."""
+        self._gpu_timer = None
+        self._flush_gpu()
+    
+    def _apply_gpu(self, gpu: "GpuStats") -> None:
+        """Push a GPU stats payload into the footer and the screen's vram-* class."""
+        vram = self._vram_footer
+        vram.cuda_available = gpu.cuda
+        vram.gpu_name = gpu.name
+        self._set_if_moved(vram, "vram_app", gpu.app)
+        self._set_if_moved(vram, "vram_system", gpu.system)
+        self._set_if_moved(vram, "vram_free", gpu.free)
+        self._set_if_moved(vram, "vram_total", gpu.total)
+        vram.debug = self.engine.config.debug
         
+        # Calculate VRAM percentage and set app-wide CSS class
+        vram_total = gpu.total
+        vram_free = gpu.free
+        pct_free = (vram_free / vram_total) * 100 if vram_total > 0 else 100
+        
+        # Debug mode: more aggressive thresholds
+        thresholds = _DEBUG_TH if self.engine.config.debug else _NORMAL_TH
+        level = _LEVELS[bisect_left(thresholds, pct_free)]
+        
+        # Update screen CSS class (only on change - each swap restyles the screen)
+        if level != self._vram_level:
+            screen = self.screen
+            if self._vram_level is not None:
+                screen.remove_class(f"vram-{self._vram_level}")
+            screen.add_class(f"vram-{level}")
+            self._vram_level = level
+    
+    def _apply_events(self, pending: list) -> None:
+        """Apply one drained batch of engine events to the widgets."""
+        header = self._status_header
+        panel = self._dictation_panel
+        log = self._dictation_log
+        draft = self._draft_line
+        
+        latest_draft = None
+        latest_phase = None
+        latest_gpu = None
+        final_lines = []  # written to the log in one go after the drain
+        cleared = False  # chunk count reset, applied with the title after the drain
+        for kind, payload in pending:
+            if kind == "status":
+                header.status_text = str(payload)
+                header.clipboard_mode = self.engine.clipboard_mode
+            
+            elif kind == "phase":
+                latest_phase = payload
+            
+            elif kind == "draft":
+                latest_draft = str(payload)
+            
+            elif kind == "final":
+                final_lines.append(payload)  # engine sends stripped, non-empty text
+                latest_draft = ""
+            
+            elif kind == "gpu":
+                latest_gpu = payload
+            
+            elif kind == "clear":
+                log.clear()
+                final_lines.clear()
+                latest_draft = ""
+                cleared = True
+        
+        # Border title is rewritten at most once per batch
+        if cleared:
+            self._chunk_count = 0
+        if final_lines:
+            log.add_finals(final_lines)
+            self._chunk_count += len(final_lines)
+        if cleared or final_lines:
+            panel.update_title(self._chunk_count)
+        if latest_draft is not None:
+            draft.draft = latest_draft
+        if latest_gpu is not None:
+            self._pending_gpu = latest_gpu
+            self._flush_gpu()
+        if latest_phase is not None:
+            header.phase = latest_phase
+            draft.active = latest_phase in self.ACTIVE_PHASES
+    
+    async def _poll_engine_events(self) -> None:
+        """Apply engine events to the UI whenever events_ready is set; runs until cancelled."""
         # Initialize panel title
-        panel.update_title(self._chunk_count)
+        self._dictation_panel.update_title(self._chunk_count)
         
-        while not self.engine.stop_event.is_set():
-            # Process all pending events
-            events_processed = 0
-            while events_processed < 50:
-                try:
-                    kind, payload = self.engine.events.get_nowait()
-                    events_processed += 1
-                    
-                    if kind == "status":
-                        header.status_text = str(payload)
-                    
-                    elif kind == "phase":
-                        # Convert engine.Phase to widgets.Phase by name
-                        try:
-                            ui_phase = Phase[payload.name]
-                            header.phase = ui_phase
-                            draft.active = ui_phase in (Phase.LISTENING, Phase.SPEAKING)
-                        except (KeyError, AttributeError):
-                            pass
-                    
-                    elif kind == "draft":
-                        draft.draft = str(payload)
-                    
-                    elif kind == "final":
-                        txt = str(payload).strip()
-                        if txt:
-                            log.add_final(txt)
-                            self._chunk_count += 1
-                            panel.update_title(self._chunk_count)
-                        draft.draft = ""
-                    
-                    elif kind == "gpu":
-                        gpu = payload if isinstance(payload, dict) else {}
-                        vram.cuda_available = gpu.get("cuda", False)
-                        vram.gpu_name = gpu.get("gpu", "")
-                        vram.vram_app = gpu.get("vram_app_gb", 0.0)
-                        vram.vram_system = gpu.get("vram_system_gb", 0.0)
-                        vram.vram_free = gpu.get("vram_free_gb", 0.0)
-                        vram.vram_total = gpu.get("vram_total_gb", 1.0)
-                        vram.debug = self.engine.config.debug
-                        
-                        # Calculate VRAM percentage and set app-wide CSS class
-                        vram_total = gpu.get("vram_total_gb", 1.0)
-                        vram_free = gpu.get("vram_free_gb", 0.0)
-                        pct_free = (vram_free / vram_total) * 100 if vram_total > 0 else 100
-                        
-                        # Debug mode: more aggressive thresholds
-                        if self.engine.config.debug:
-                            if pct_free > 80:
-                                level = "normal"
-                            elif pct_free > 70:
-                                level = "warning"
-                            elif pct_free > 60:
-                                level = "danger"
-                            else:
-                                level = "critical"
-                        else:
-                            # Normal thresholds
-                            if pct_free > 50:
-                                level = "normal"
-                            elif pct_free > 30:
-                                level = "warning"
-                            elif pct_free > 15:
-                                level = "danger"
-                            else:
-                                level = "critical"
-                        
-                        # Update screen CSS class
-                        self.screen.remove_class("vram-normal", "vram-warning", "vram-danger", "vram-critical")
-                        self.screen.add_class(f"vram-{level}")
-                    
-                    elif kind == "clear":
-                        log.clear()
-                        draft.draft = ""
-                        self._chunk_count = 0
-                        panel.update_title(0)
-                
-                except queue.Empty:
-                    break
+        ready = self.engine.events_ready
+        while True:
+            # Sleep until the engine posts something; quitting cancels this wait
+            await ready.wait()
+            ready.clear()
             
-            # Check if we should quit
-            if self.engine.stop_event.is_set():
-                self.exit()
-                break
+            # Drain what's pending; only the newest draft/phase is worth rendering
+            events = self.engine.events
+            pending = []
+            while events and len(pending) < self.MAX_BATCH:
+                pending.append(events.popleft())
+            if events:
+                ready.set()  # more left - pick it up next iteration
             
-            await asyncio.sleep(0.05)
+            # One repaint for the whole batch, however many widgets it touches
+            with self.batch_update():
+                self._apply_events(pending)
+            
+            if len(pending) == self.MAX_BATCH:
+                await asyncio.sleep(0)  # let Textual render before the next batch
+    
+    async def _wait_engine_stopped(self) -> None:
+        """Exit once the engine stops (Ctrl+Alt+Q)."""
+        await self.engine.stopped.wait()
+        self._poll_worker.cancel()
+        self.exit()
     
-    async def _blink_cursor(self) -> None:
+    def _tick_blink(self) -> None:
         """Toggle cursor blink state."""
-        draft = self.query_one("#draft", DraftLine)
-        while not self.engine.stop_event.is_set():
-            self._blink_state = not self._blink_state
-            draft.blink = self._blink_state
-            await asyncio.sleep(0.6)
+        self._blink_state = not self._blink_state
+        self._draft_line.blink = self._blink_state
@@ -3,19 +3,38 @@ from textual.widgets import Static, RichLog, ProgressBar
 from textual.containers import Vertical
 from textual.reactive import reactive
 from textual.app import ComposeResult
+from rich.markup import escape
+from rich.style import Style
 from rich.text import Text
 
-# Import Phase from parent package
-from enum import Enum, auto
+from enum import IntEnum
 
 
-class Phase(Enum):
-    """Mirror of engine.Phase to avoid circular imports."""
-    OFF = auto()
-    LISTENING = auto()
-    SPEAKING = auto()
-    THINKING = auto()
-    LOADING = auto()
+class Phase(IntEnum):
+    """Dictation phase; the engine posts these directly in ("phase", ...) events.
+    
+    Values index StatusHeader.PHASE_ROWS directly.
+    """
+    OFF = 0          # dictation toggled off
+    LOADING = 1      # model loading at startup
+    LISTENING = 2    # VAD listening, no speech yet
+    SPEAKING = 3     # speech detected
+    THINKING = 4     # transcribing / finalizing
+
+
+def _hotkey_legend() -> Text:
+    """Header line 2 - constant, so it is built once at import."""
+    text = Text()
+    text.append("Ctrl+Alt+D ", style="cyan")
+    text.append("toggle", style="dim")
+    text.append("  |  ", style="dim")
+    text.append("Ctrl+Alt+C ", style="cyan")
+    text.append("clipboard", style="dim")
+    text.append("  |  ", style="dim")
+    text.append("Ctrl+Alt+Q ", style="cyan")
+    text.append("quit", style="dim")
+    text.append("\n\n")
+    return text
 
 
 class StatusHeader(Static):
@@ -27,36 +46,45 @@ class StatusHeader(Static):
     status_text: reactive[str] = reactive("INIT")
     debug: reactive[bool] = reactive(False)
     
-    PHASE_STYLES = {
-        Phase.OFF: ("OFF      ", "dim white"),
-        Phase.LOADING: ("LOADING  ", "yellow"),
-        Phase.LISTENING: ("LISTENING", "cyan"),
-        Phase.SPEAKING: ("SPEAKING ", "bright_green"),
-        Phase.THINKING: ("THINKING ", "turquoise2"),  # between cyan and green
-    }
+    # Indexed by Phase value
+    PHASE_ROWS = (
+        ("OFF      ", "dim white"),
+        ("LOADING  ", "yellow"),
+        ("LISTENING", "cyan"),
+        ("SPEAKING ", "bright_green"),
+        ("THINKING ", "turquoise2"),  # between cyan and green
+    )
+    HOTKEYS = _hotkey_legend()
     
-    def render(self) -> Text:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session_line = self._build_session_line(0)
+    
+    @staticmethod
+    def _build_session_line(session_id: int) -> Text:
         text = Text()
-        
-        # Line 1: Session + Title
-        text.append(f"Session {self.session_id:03d}", style="bold bright_white")
+        text.append(f"Session {session_id:03d}", style="bold bright_white")
         text.append("  |  ", style="dim")
         text.append("RealtimeSTT Dictation", style="bold")
         text.append("\n")
+        return text
+    
+    def watch_session_id(self, session_id: int) -> None:
+        self._session_line = self._build_session_line(session_id)
+    
+    def render(self) -> Text:
+        text = Text()
         
-        # Line 2: Hotkeys
-        text.append("Ctrl+Alt+D ", style="cyan")
-        text.append("toggle", style="dim")
-        text.append("  |  ", style="dim")
-        text.append("Ctrl+Alt+C ", style="cyan")
-        text.append("clipboard", style="dim")
-        text.append("  |  ", style="dim")
-        text.append("Ctrl+Alt+Q ", style="cyan")
-        text.append("quit", style="dim")
-        text.append("\n\n")
+        # Lines 1-2: Session + Title, Hotkeys (cached - they rarely/never change)
+        text.append_text(self._session_line)
+        text.append_text(self.HOTKEYS)
         
         # Line 3: State + Mode
-        phase_text, phase_style = self.PHASE_STYLES.get(self.phase, ("UNKNOWN  ", "white"))
+        phase = self.phase
+        if 0 <= phase < len(self.PHASE_ROWS):
+            phase_text, phase_style = self.PHASE_ROWS[phase]
+        else:
+            phase_text, phase_style = ("UNKNOWN  ", "white")
         text.append("State: ", style="dim")
         text.append(phase_text, style=phase_style)
         text.append(" | ", style="dim")
@@ -77,14 +105,18 @@ class StatusHeader(Static):
 class DictationLog(RichLog):
     """Scrollable log for dictation output using Textual's RichLog."""
     
+    MAX_LINES = 200  # older lines are dropped (full text is in the session log)
+    FINAL_STYLE = Style.parse("white")
+    
     def __init__(self, **kwargs):
-        super().__init__(highlight=False, markup=False, wrap=True, **kwargs)
+        super().__init__(highlight=False, markup=False, wrap=True, max_lines=self.MAX_LINES, **kwargs)
         self._draft = ""
         self._draft_line_id = None
     
-    def add_final(self, text: str) -> None:
-        """Add a finalized line to the log."""
-        self.write(Text(f"- {text}", style="white"))
+    def add_finals(self, texts: list) -> None:
+        """Add finalized lines to the log in one write (one layout/scroll pass)."""
+        # One Text for the batch - still word-wrapped by RichLog, unlike raw Segments
+        self.write(Text("\n".join(f"- {text}" for text in texts), style=self.FINAL_STYLE))
     
     def update_draft(self, text: str) -> None:
         """Update the current draft line (mutable, with cursor)."""
@@ -104,15 +136,21 @@ class DraftLine(Static):
     blink: reactive[bool] = reactive(True)
     active: reactive[bool] = reactive(False)  # whether we're in LISTENING/SPEAKING state
     
+    DRAFT_STYLE = Style.parse("green1")
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Idle frames (no draft) just return one of these - no per-blink allocation
+        self._cursor_on = Text(" \u2588", style=Style.parse("green1 bold"))
+        self._idle_on = Text("\u2588", style=Style.parse("green1 dim"))
+        self._empty = Text()
+    
     def render(self) -> Text:
-        text = Text()
-        if self.draft:
-            text.append(self.draft, style="green1")
-            if self.blink:
-                text.append(" \u2588", style="green1 bold")
-        elif self.active:
-            if self.blink:
-                text.append("\u2588", style="green1 dim")
+        if not self.draft:
+            return self._idle_on if (self.active and self.blink) else self._empty
+        text = Text(self.draft, style=self.DRAFT_STYLE)
+        if self.blink:
+            text.append_text(self._cursor_on)
         return text
 
 
@@ -126,25 +164,40 @@ class VRAMText(Static):
     vram_total: reactive[float] = reactive(1.0)
     cuda_available: reactive[bool] = reactive(False)
     
+    NO_CUDA = Text("GPU: (no CUDA)", style="dim red")
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Formatted values, refreshed only when the underlying value changes
+        self._fmt = {"name": "Unknown GPU", "app": "0.0 GB", "system": "0.0 GB", "free": "0.0", "total": "1.0 GB"}
+    
+    def watch_gpu_name(self, value: str) -> None:
+        self._fmt["name"] = escape(value or "Unknown GPU")
+    
+    def watch_vram_app(self, value: float) -> None:
+        self._fmt["app"] = f"{value:.1f} GB"
+    
+    def watch_vram_system(self, value: float) -> None:
+        self._fmt["system"] = f"{value:.1f} GB"
+    
+    def watch_vram_free(self, value: float) -> None:
+        self._fmt["free"] = f"{value:.1f}"
+    
+    def watch_vram_total(self, value: float) -> None:
+        self._fmt["total"] = f"{value:.1f} GB"
+    
     def render(self) -> Text:
-        text = Text()
-        
         if not self.cuda_available:
-            text.append("GPU: (no CUDA)", style="dim red")
-            return text
-        
-        text.append(self.gpu_name or "Unknown GPU", style="bright_white")
-        text.append("  |  ", style="dim")
-        text.append("App: ", style="dim")
-        text.append(f"{self.vram_app:.1f} GB", style="cyan")
-        text.append("  |  ", style="dim")
-        text.append("System: ", style="dim")
-        text.append(f"{self.vram_system:.1f} GB", style="yellow")
-        text.append("  |  ", style="dim")
-        text.append("Free: ", style="dim")
-        text.append(f"{self.vram_free:.1f} / {self.vram_total:.1f} GB", style="bright_white")
+            return self.NO_CUDA
         
-        return text
+        # One markup parse instead of a dozen appends; GPU name is escaped
+        fmt = self._fmt
+        return Text.from_markup(
+            f"[bright_white]{fmt['name']}[/]"
+            f"[dim]  |  App: [/][cyan]{fmt['app']}[/]"
+            f"[dim]  |  System: [/][yellow]{fmt['system']}[/]"
+            f"[dim]  |  Free: [/][bright_white]{fmt['free']} / {fmt['total']}[/]"
+        )
 
 
 class VRAMFooter(Vertical):
@@ -158,51 +211,54 @@ class VRAMFooter(Vertical):
     cuda_available: reactive[bool] = reactive(False)
     debug: reactive[bool] = reactive(False)
     
+    # Stats mirrored onto the children
+    _SYNCED = ("gpu_name", "vram_app", "vram_system", "vram_free", "vram_total", "cuda_available")
+    
     def compose(self) -> ComposeResult:
         yield ProgressBar(total=100, show_eta=False, id="vram-bar")
         yield VRAMText(id="vram-text")
     
-    def on_mount(self) -> None:
-        """Initialize the progress bar."""
-        self._update_children()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sync_pending = False
+        self._bar = None
+        self._text = None
     
-    def watch_vram_free(self) -> None:
-        self._update_children()
-    
-    def watch_vram_total(self) -> None:
-        self._update_children()
-    
-    def watch_vram_app(self) -> None:
-        self._update_children()
-    
-    def watch_vram_system(self) -> None:
+    def on_mount(self) -> None:
+        """Cache the children and sync them whenever any stat changes."""
+        self._bar = self.query_one("#vram-bar", ProgressBar)
+        self._text = self.query_one("#vram-text", VRAMText)
+        for attr in self._SYNCED:
+            self.watch(self, attr, self._sync_soon, init=False)
         self._update_children()
     
-    def watch_gpu_name(self) -> None:
-        self._update_children()
+    def _sync_soon(self) -> None:
+        """Coalesce a burst of stat changes into one child update after the next refresh."""
+        if not self._sync_pending:
+            self._sync_pending = True
+            self.call_after_refresh(self._do_sync)
     
-    def watch_cuda_available(self) -> None:
+    def _do_sync(self) -> None:
+        self._sync_pending = False
         self._update_children()
     
     def _update_children(self) -> None:
         """Update progress bar and text with current values."""
-        try:
-            bar = self.query_one("#vram-bar", ProgressBar)
-            text = self.query_one("#vram-text", VRAMText)
-            
-            # Update text widget
-            text.gpu_name = self.gpu_name
-            text.vram_app = self.vram_app
-            text.vram_system = self.vram_system
-            text.vram_free = self.vram_free
-            text.vram_total = self.vram_total
-            text.cuda_available = self.cuda_available
-            
-            # Update progress bar (shows % used, not free)
-            if self.vram_total > 0:
-                pct_used = ((self.vram_total - self.vram_free) / self.vram_total) * 100
-                bar.progress = pct_used
-            else:
-                bar.progress = 0
-        except Exception:
-            pass  # Widget not yet mounted
+        bar = self._bar
+        text = self._text
+        
+        # Update text widget
+        text.gpu_name = self.gpu_name
+        text.vram_app = self.vram_app
+        text.vram_system = self.vram_system
+        text.vram_free = self.vram_free
+        text.vram_total = self.vram_total
+        text.cuda_available = self.cuda_available
+        
+        # Update progress bar (shows % used, not free); whole percents only
+        if self.vram_total > 0:
+            pct_used = round(((self.vram_total - self.vram_free) / self.vram_total) * 100)
+        else:
+            pct_used = 0
+        if bar.progress != pct_used:
+            bar.progress = pct_used